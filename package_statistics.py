@@ -3,23 +3,76 @@
 import argparse
 import gzip
 import logging
+import multiprocessing
 import os
 import sys
-from collections import defaultdict
-from io import BytesIO
-from operator import itemgetter
-from typing import DefaultDict, Iterator, Union
+import tempfile
+import threading
+import zlib
+from collections import Counter, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from email.utils import formatdate, parsedate_to_datetime
+from io import BufferedReader
+from queue import Queue
+from typing import (
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+try:
+    from isal import igzip_threaded, isal_zlib
+except ImportError:
+    # isal is optional, the stdlib gzip and zlib modules are used when it isn't installed
+    igzip_threaded = isal_zlib = None
+
+try:
+    # Optional C++ extension, see setup.py for building it
+    from pkg_count import count_packages
+except ImportError:
+    count_packages = None
 
 from benchmarking import benchmark_with_repeater
 
 # Set the default base URL as a global variable
 DEFAULT_BASE_URL = os.getenv("PACKAGE_MIRROR_URL", "http://ftp.uk.debian.org/debian")
+# Size of the blocks read from the decompressed gzip stream
+READ_BUFFER_SIZE = 128 * 1024
+# Upper limit for the size of the blocks decompressed from the downloaded gzip stream
+DECOMPRESSED_BLOCK_SIZE = 1 << 20
+# Size of the blocks of complete lines that are parsed at once
+PARSE_BLOCK_SIZE = 4 * 1024 * 1024
+# Number of parse blocks that are read ahead while the current block is parsed
+PREFETCH_BLOCKS = 4
+# Minimum number of connections kept open to the mirror, raised for more parallel range requests
+POOL_MAXSIZE = 8
+# Errors raised by the zlib compatible decompressors for invalid compressed data
+DECOMPRESSION_ERRORS = (
+    (zlib.error,) if isal_zlib is None else (zlib.error, isal_zlib.error)
+)
+
+# Reuse the connections to the mirror across the requests, including the parallel range requests
+_SESSION = requests.Session()
+# The Contents files are already gzip compressed, don't let the mirror encode them again
+_SESSION.headers["Accept-Encoding"] = "identity"
 
 
 def setup_logging(logfile: str) -> None:
     """Sets up basic logging"""
+    # basicConfig ignores the handlers if logging is already set up,
+    #   but the FileHandler would still be created and open the logfile again
+    if logging.getLogger().hasHandlers():
+        return
     logging.basicConfig(
         # Switch to logging.WARN for less logging output
         # level=logging.WARN,
@@ -29,58 +82,366 @@ def setup_logging(logfile: str) -> None:
     )
 
 
-def read_gzip_contents(source: Union[str, bytes]) -> Iterator[str]:
-    """Reads and decompresses a gzip file from a file path or bytes line by line"""
+def setup_session(download_parts: int) -> None:
+    """Sizes the connection pools of the session, so that every parallel range request
+    reuses its own connection instead of one that's discarded when the pool is full"""
+    adapter = HTTPAdapter(
+        pool_connections=4, pool_maxsize=max(download_parts, POOL_MAXSIZE)
+    )
+    _SESSION.mount("http://", adapter)
+    _SESSION.mount("https://", adapter)
+
+
+def open_gzip(source: Union[str, BinaryIO]) -> BinaryIO:
+    """Opens a gzip file path or file object for binary reading with the fastest available decompressor"""
+    # Both decompressors check the CRC and length in the gzip trailer, and raise an error
+    #   for truncated files. rapidgzip isn't used, it reads truncated files without an error.
+    if igzip_threaded is not None:
+        # ISA-L inflates with SIMD instructions, in a background thread
+        return igzip_threaded.open(source, "rb", threads=os.cpu_count() or 1)
+    return BufferedReader(gzip.open(source, "rb"), buffer_size=READ_BUFFER_SIZE)
+
+
+def split_line_blocks(
+    blocks: Iterable[bytes], block_size: int = PARSE_BLOCK_SIZE
+) -> Iterator[bytes]:
+    """Regroups a stream of decompressed blocks into blocks of about block_size bytes
+    that end at a newline, so that every block only contains complete lines"""
+    pending: List[bytes] = []
+    pending_size = 0
+    for block in blocks:
+        pending.append(block)
+        pending_size += len(block)
+        if pending_size < block_size:
+            continue
+        # Cut after the last newline of the block that fills up a parse block, and carry the
+        #   partial line over. Cutting the block instead of the joined bytes copies them only once.
+        end = block.rfind(b"\n") + 1
+        if end:
+            pending[-1] = block[:end]
+            yield b"".join(pending)
+            pending = [block[end:]]
+            pending_size = len(block) - end
+        else:
+            # The block has no newline, cut after the last newline of the earlier blocks
+            data = b"".join(pending)
+            end = data.rfind(b"\n") + 1
+            if end:
+                yield data[:end]
+            pending = [data[end:]]
+            pending_size = len(data) - end
+    if pending_size:
+        yield b"".join(pending)
+
+
+def prefetch_blocks(
+    blocks: Iterable[bytes], maxsize: int = PREFETCH_BLOCKS
+) -> Iterator[bytes]:
+    """Reads the blocks in a background thread, so that downloading and decompressing the next
+    blocks overlaps with parsing the current one. At most maxsize blocks are queued."""
+    queue: Queue = Queue(maxsize=maxsize)
+    stopped = threading.Event()
+
+    def produce() -> None:
+        try:
+            for block in blocks:
+                if stopped.is_set():
+                    return
+                queue.put(block)
+            queue.put(None)
+        # Hand over every exception to the consumer, including the SystemExit of the readers
+        except BaseException as e:
+            queue.put(e)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while (item := queue.get()) is not None:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # Stop the producer and unblock it if it's waiting on a full queue
+        stopped.set()
+        while producer.is_alive():
+            while not queue.empty():
+                queue.get_nowait()
+            producer.join(timeout=0.1)
+
+
+def read_gzip_contents(source: Union[str, BinaryIO]) -> Iterator[bytes]:
+    """Reads and decompresses a gzip file from a file path or file object in blocks of complete lines"""
     logging.info("Reading gzip contents")
     try:
-        if isinstance(source, str):
-            with gzip.open(source, "rt") as f:
-                for line in f:
-                    yield line
-        else:
-            with gzip.open(BytesIO(source), "rt") as f:
-                for line in f:
-                    yield line
+        with open_gzip(source) as f:
+            # Read the decompressed stream in large binary blocks and regroup them at line boundaries
+            yield from split_line_blocks(iter(lambda: f.read(READ_BUFFER_SIZE), b""))
 
     except gzip.BadGzipFile as e:
         logging.error(f"Bad gzip file {e}")
         sys.exit(1)
-    except OSError as e:
+    # EOFError is raised for truncated files and ISA-L raises IsalError for invalid gzip files
+    except (OSError, EOFError, *DECOMPRESSION_ERRORS) as e:
         logging.error(f"Error reading gzip file: {e}")
         sys.exit(1)
 
     logging.info("Successfully read the gzip contents")
 
 
-def download_contents_file(architecture: str, base_url: str) -> bytes:
-    """Downloads the Contents file from the Debian mirror"""
-    url = f"{base_url}/dists/stable/main/Contents-{architecture}.gz"
+def contents_file_url(architecture: str, base_url: str) -> str:
+    """Returns the URL of the Contents file on the Debian mirror"""
+    return f"{base_url}/dists/stable/main/Contents-{architecture}.gz"
+
+
+def conditional_headers(local_filename: str) -> Dict[str, str]:
+    """Returns an If-Modified-Since header with the modification time of the local
+    Contents file, if it exists, so that the mirror answers with 304 Not Modified
+    when the file hasn't changed"""
+    if not os.path.isfile(local_filename):
+        return {}
+    return {
+        "If-Modified-Since": formatdate(os.path.getmtime(local_filename), usegmt=True)
+    }
+
+
+def set_last_modified(path_or_fd: Union[str, int], response: requests.Response) -> None:
+    """Sets the modification time of a downloaded Contents file to its Last-Modified
+    time on the mirror, so that the following If-Modified-Since headers compare the
+    mirror's own timestamps"""
+    try:
+        timestamp = parsedate_to_datetime(response.headers["Last-Modified"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return
+    os.utime(path_or_fd, (timestamp, timestamp))
+
+
+def download_contents_file(
+    architecture: str, base_url: str, headers: Optional[Dict[str, str]] = None
+) -> requests.Response:
+    """Starts downloading the Contents file from the Debian mirror, the body is streamed"""
+    url = contents_file_url(architecture, base_url)
     logging.info(f"Downloading Contents file from {url}")
     try:
-        response = requests.get(url, timeout=30, stream=True)
+        response = _SESSION.get(url, headers=headers, timeout=30, stream=True)
         response.raise_for_status()
     except requests.RequestException as e:
         logging.error(f"Failed to download Contents file: {e}")
         raise
 
+    return response
+
+
+def range_validator(response: requests.Response) -> Optional[str]:
+    """Returns the validator of the Contents file for the If-Range header of the range requests,
+    its strong ETag or else its Last-Modified time"""
+    etag = response.headers.get("ETag")
+    # If-Range only accepts strong ETags
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+def download_range(url: str, fd: int, start: int, end: int, validator: str) -> bool:
+    """Downloads the bytes from start to end (inclusive) of url and writes them at the
+    same offsets of fd. Returns False if the mirror ignores the Range header or the
+    file has changed since the validator."""
+    headers = {"Range": f"bytes={start}-{end}", "If-Range": validator}
+    with _SESSION.get(url, headers=headers, timeout=30, stream=True) as response:
+        response.raise_for_status()
+        # A 200 response means the mirror ignored the Range header, or the file has changed
+        #   on the mirror and it sends the whole new version instead of mixing two versions
+        if response.status_code != 206:
+            return False
+        offset = start
+        while chunk := response.raw.read(READ_BUFFER_SIZE, decode_content=False):
+            offset += os.pwrite(fd, chunk, offset)
+    if offset != end + 1:
+        raise requests.RequestException(
+            f"Received {offset - start} bytes instead of {end + 1 - start} for the range {start}-{end}"
+        )
+    return True
+
+
+def download_contents_file_in_parts(
+    architecture: str,
+    base_url: str,
+    file: BinaryIO,
+    parts: int,
+    headers: Optional[Dict[str, str]] = None,
+) -> bool:
+    """Downloads the Contents file from the Debian mirror into file with parallel HTTP
+    Range requests. Returns False if the mirror doesn't support range requests or the
+    file isn't modified."""
+    url = contents_file_url(architecture, base_url)
+    logging.info(f"Downloading Contents file from {url} in {parts} parts")
+    try:
+        response = _SESSION.head(url, headers=headers, timeout=30, allow_redirects=True)
+        response.raise_for_status()
+        # Not modified, the conditional request of the single stream download reuses the local file
+        if response.status_code == 304:
+            return False
+        total_size = int(response.headers.get("Content-Length", 0))
+        validator = range_validator(response)
+        if (
+            response.headers.get("Accept-Ranges") != "bytes"
+            or not total_size
+            or not validator
+        ):
+            logging.info("The mirror doesn't support range requests")
+            return False
+
+        # Every part is written to its own disjoint range of the file, no locking is needed
+        file.truncate(total_size)
+        part_size = -(-total_size // parts)
+        ranges = [
+            (start, min(start + part_size, total_size) - 1)
+            for start in range(0, total_size, part_size)
+        ]
+        # Request the parts from where the HEAD request was redirected to, so that all of them
+        #   reach the same host as the HEAD request
+        url = response.url
+        # Downloading is I/O-bound, the threads release the GIL while they wait on the sockets
+        with ThreadPoolExecutor(max_workers=parts) as executor:
+            results = list(
+                executor.map(
+                    lambda r: download_range(url, file.fileno(), *r, validator), ranges
+                )
+            )
+        if not all(results):
+            logging.info("The mirror didn't send the requested ranges of the same file")
+            return False
+        set_last_modified(file.fileno(), response)
+
+    except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+        logging.error(f"Failed to download Contents file: {e}")
+        raise
+
     logging.info("Successfully downloaded the Contents file")
-    return response.content
+    return True
 
 
-def save_contents_file(file_path: str, content: bytes) -> None:
-    """Saves the downloaded Contents gzip file locally"""
-    with open(file_path, "wb") as f:
-        f.write(content)
-    logging.info(f"Saved downloaded Contents file as {file_path}")
+def iter_decompressed_blocks(
+    response: requests.Response, save_path: Optional[str] = None
+) -> Iterator[bytes]:
+    """Decompresses the gzip body of a streamed response block by block while it's being downloaded.
+    The compressed bytes are also written to save_path, if it's given."""
+    # wbits=31 makes zlib expect a gzip header and trailer, isal_zlib is a faster drop-in replacement
+    decompressor = (isal_zlib or zlib).decompressobj(wbits=31)
+    # The file is written under a temporary name and renamed when the download is complete,
+    # so that an interrupted download never leaves a truncated Contents file behind
+    partial_path = f"{save_path}.part" if save_path else None
+    save_file = open(partial_path, "wb") if partial_path else None
+    completed = False
+    try:
+        # decode_content=False returns the gzip bytes as they are sent by the mirror
+        while raw_chunk := response.raw.read(READ_BUFFER_SIZE, decode_content=False):
+            if save_file:
+                save_file.write(raw_chunk)
+            data = raw_chunk
+            while data:
+                if decompressor.eof:
+                    # A gzip file can consist of several members. Like the gzip module,
+                    #   decompress the following members and skip the zero padding.
+                    data = data.lstrip(b"\0")
+                    if not data:
+                        break
+                    decompressor = (isal_zlib or zlib).decompressobj(wbits=31)
+                # Limit the size of each decompressed block, the rest of the input is kept in
+                # unconsumed_tail and fed to the decompressor until it doesn't produce any more output
+                block = decompressor.decompress(data, DECOMPRESSED_BLOCK_SIZE)
+                if block:
+                    yield block
+                # The input after the end of a member is kept in unused_data
+                data = (
+                    decompressor.unused_data
+                    if decompressor.eof
+                    else decompressor.unconsumed_tail
+                )
+        if not decompressor.eof:
+            raise zlib.error(
+                "compressed file ended before the end-of-stream marker was reached"
+            )
+        completed = True
+
+    except urllib3.exceptions.HTTPError as e:
+        logging.error(f"Failed to download Contents file: {e}")
+        raise
+    except DECOMPRESSION_ERRORS as e:
+        logging.error(f"Error decompressing the downloaded Contents file: {e}")
+        sys.exit(1)
+    finally:
+        response.close()
+        if save_file:
+            save_file.close()
+            if completed:
+                os.replace(partial_path, save_path)
+                set_last_modified(save_path, response)
+            else:
+                os.remove(partial_path)
+
+    logging.info("Successfully downloaded the Contents file")
+    if save_path:
+        logging.info(f"Saved downloaded Contents file as {save_path}")
+
+
+def read_contents_file_in_parts(
+    args, local_filename: str, headers: Dict[str, str]
+) -> Optional[Iterator[bytes]]:
+    """Downloads the Contents file in parallel parts and reads it. Returns None if the
+    mirror doesn't support range requests or the file isn't modified."""
+    # Download into a .part file if it's going to be saved, otherwise into an anonymous temporary file
+    partial_path = f"{local_filename}.part" if args.save_file_locally else None
+    file = open(partial_path, "w+b") if partial_path else tempfile.TemporaryFile()
+    completed = False
+    try:
+        completed = download_contents_file_in_parts(
+            args.architecture, args.base_url, file, args.download_parts, headers
+        )
+    finally:
+        if not completed:
+            file.close()
+            if partial_path:
+                os.remove(partial_path)
+    if not completed:
+        return None
+
+    if partial_path:
+        file.close()
+        return read_downloaded_file(partial_path, local_filename)
+    return read_temporary_file(file)
+
+
+def read_temporary_file(file: BinaryIO) -> Iterator[bytes]:
+    """Reads a Contents file downloaded in parts into a temporary file, which is deleted afterwards"""
+    with file:
+        file.seek(0)
+        yield from read_gzip_contents(file)
+
+
+def read_downloaded_file(partial_path: str, save_path: str) -> Iterator[bytes]:
+    """Reads a Contents file downloaded in parts and renames it to save_path once it has been
+    decompressed completely, including the check of the gzip trailer"""
+    completed = False
+    try:
+        yield from read_gzip_contents(partial_path)
+        completed = True
+    finally:
+        # Never keep a corrupt file, it would be reused by the conditional requests
+        if completed:
+            os.replace(partial_path, save_path)
+            logging.info(f"Saved downloaded Contents file as {save_path}")
+        else:
+            os.remove(partial_path)
 
 
-def read_contents_file(args) -> Iterator[str]:
+def read_contents_file(args) -> Iterator[bytes]:
     """Reads the contents file either from a local cache or by downloading it from the Debian mirror."""
     local_filename = f"Contents-{args.architecture}.gz"
     # If --use-cache is given, check the local gzip file, read it if it exists
-    # Otherwise, download the gzip file
+    # Otherwise, download the gzip file and decompress it while it's being downloaded
     #   - save the gzip file locally if --save-file-locally is given
-    #   - read the gzip file
+    #   - with --save-file-locally, read the saved gzip file instead if the mirror says
+    #     it's not modified since it was saved
     if args.use_cache:
         if not os.path.isfile(local_filename):
             logging.error(
@@ -91,24 +452,92 @@ def read_contents_file(args) -> Iterator[str]:
         return read_gzip_contents(local_filename)
 
     else:
-        content_bytes = download_contents_file(args.architecture, args.base_url)
-        if args.save_file_locally:
-            save_contents_file(local_filename, content_bytes)
-        return read_gzip_contents(content_bytes)
+        # Only --save-file-locally owns the local file, it isn't reused without it
+        headers = conditional_headers(local_filename) if args.save_file_locally else {}
+        if args.download_parts > 1:
+            blocks = read_contents_file_in_parts(args, local_filename, headers)
+            if blocks is not None:
+                return blocks
+
+        response = download_contents_file(args.architecture, args.base_url, headers)
+        if response.status_code == 304:
+            response.close()
+            logging.info(
+                f"The Contents file isn't modified since {local_filename} was saved"
+            )
+            return read_gzip_contents(local_filename)
+        save_path = local_filename if args.save_file_locally else None
+        return split_line_blocks(iter_decompressed_blocks(response, save_path))
 
 
-def parse_contents(lines: Iterator[str]) -> DefaultDict[str, int]:
+def extract_package_names(block: bytes) -> List[bytes]:
+    """Extracts the package names of all the lines in a block of complete lines"""
+    # Keep only the last column of each line, split only once from the last whitespace.
+    # rsplit handles both tab and space separators, and it isn't slower than rfind + slicing,
+    #   even though it also creates the discarded file path.
+    # The arguments are passed positionally, parsing maxsplit as a keyword on every line is slower.
+    # Empty and whitespace-only lines split into no columns and are skipped.
+    package_columns = [
+        columns[-1] for line in block.split(b"\n") if (columns := line.rsplit(None, 1))
+    ]
+    if not package_columns:
+        return []
+    # Flatten the comma separated package lists of all the lines with a single join and split
+    return b",".join(package_columns).split(b",")
+
+
+def count_block_in_worker(block: bytes) -> Dict[bytes, int]:
+    """Counts the number of files for each package in a block in a worker process.
+    The counts are returned instead of the package names, they're smaller to pickle."""
+    if count_packages is not None:
+        return count_packages(block)
+    return Counter(extract_package_names(block))
+
+
+def map_bounded(
+    executor: Executor, func: Callable, items: Iterable, window: int
+) -> Iterator:
+    """Like executor.map, but keeps at most `window` items in flight instead of
+    consuming the whole iterable up front"""
+    pending: Deque[Future] = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def parse_contents(blocks: Iterable[bytes], processes: int = 1) -> Counter:
     """Parses the Contents file and counts the number of files for each package"""
     logging.info("Parsing the Contents file")
-    # defaultdict(int) initializes the default value of new keys to 0
-    package_counter: DefaultDict[str, int] = defaultdict(int)
-    for line in lines:
-        if not line:
-            continue
-        # split the lines only once from the last whitespace
-        file_path, package_names = line.rsplit(maxsplit=1)
-        for package_name in package_names.strip().split(","):
-            package_counter[package_name] += 1
+    package_counter: Counter = Counter()
+    if processes <= 1:
+        # Parse the blocks inline, in a single pass.
+        # Counter.update adds the counts of the extension, or counts the package names
+        #   in C, hashing each name only once
+        count_block = count_packages or extract_package_names
+        for block in blocks:
+            package_counter.update(count_block(block))
+    else:
+        # Threads don't help here, the parsing is CPU-bound and holds the GIL.
+        # The blocks are pickled to worker processes and the returned counts are merged.
+        # Counter.update adds the counts in a single pass, unlike += which makes a second
+        #   pass over all the packages to drop the non-positive counts after every merge.
+        # The prefetch and decompression threads are already running when the workers start,
+        #   forking them from this process could deadlock, so they're started from a clean one.
+        start_method = (
+            "forkserver"
+            if "forkserver" in multiprocessing.get_all_start_methods()
+            else "spawn"
+        )
+        with ProcessPoolExecutor(
+            max_workers=processes, mp_context=multiprocessing.get_context(start_method)
+        ) as executor:
+            for chunk_counts in map_bounded(
+                executor, count_block_in_worker, blocks, 2 * processes
+            ):
+                package_counter.update(chunk_counts)
 
     logging.info("Completed parsing the Contents file")
     return package_counter
@@ -143,32 +572,58 @@ def parse_arguments() -> argparse.Namespace:
     group.add_argument(
         "--save-file-locally",
         action="store_true",
-        help="Save the downloaded Contents gzip file locally for future use",
+        help="Save the downloaded Contents gzip file locally for future use, "
+        "or reuse the saved file if it isn't modified on the mirror",
+    )
+    parser.add_argument(
+        "--download-parts",
+        type=int,
+        default=1,
+        help="Number of parallel HTTP Range requests for downloading the Contents file (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-p",
+        "--processes",
+        type=int,
+        default=1,
+        help="Number of worker processes for parsing the Contents file (default: %(default)s)",
     )
     return parser.parse_args()
 
 
 # @benchmark
 @benchmark_with_repeater(repeats=5)
+def run(args: argparse.Namespace) -> None:
+    """Fetches and parses the Contents file, then outputs the top 10 packages"""
+    # Fetch the contents file and read the contents by yielding blocks of lines,
+    #   reading ahead in a background thread while the blocks are parsed
+    blocks = prefetch_blocks(read_contents_file(args))
+    # Parse the contents file and count filepaths for the packages
+    package_counter = parse_contents(blocks, args.processes)
+    # Extract the top 10 packages with the most files, most_common uses heapq.nlargest
+    #   instead of sorting all the packages
+    top_packages = package_counter.most_common(10)
+
+    # You can replace sys.stdout.write with logging.info for outputting the package names.
+    # For simplicity, the output is written to stdout at once instead of printing it line by line.
+    output_lines = ["Top 10 packages with the most files:"]
+    for i, (package_name, file_count) in enumerate(top_packages, 1):
+        # Package names are parsed as bytes, decode them only for displaying
+        output_lines.append(f"{i}. {package_name.decode().ljust(30)} {file_count}")
+    sys.stdout.write("\n".join(output_lines) + "\n")
+
+
 def main():
+    # Parse the arguments and set up logging only once, outside of the benchmarked function
     args = parse_arguments()
 
     # Set up logging
     setup_logging(args.logfile)
 
-    # Fetch the contents file and read the contents by yielding line by line
-    lines = read_contents_file(args)
-    # Parse the contents file and count filepaths for the packages
-    package_counter = parse_contents(lines)
-    # Sort the package_counter dictionary from most files to the least and extract the top 10
-    top_packages = sorted(package_counter.items(), key=itemgetter(1), reverse=True)[:10]
-
-    # You can replace print with logging.info or
-    #   overwrite the builtin print function with one that uses logging.
-    # For simplicity, print is chosen for outputting the package names.
-    print("Top 10 packages with the most files:")
-    for i, (package_name, file_count) in enumerate(top_packages, 1):
-        print(f"{i}. {package_name.ljust(30)} {file_count}")
+    # Set up the connections to the mirror
+    setup_session(args.download_parts)
+
+    run(args)
 
 
 if __name__ == "__main__":
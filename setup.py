@@ -0,0 +1,12 @@
+"""Builds the optional pkg_count C++ extension in place:
+
+    python setup.py build_ext --inplace
+"""
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name="package-statistics",
+    ext_modules=cythonize("pkg_count.pyx"),
+)